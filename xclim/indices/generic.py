@@ -72,14 +72,15 @@ def select_time(da: xr.DataArray, **indexer):
     Returns
     -------
     xr.DataArray
-      Selected input values.
+      Selected input values. Time steps with missing values are kept.
     """
     if not indexer:
         selected = da
     else:
         key, val = indexer.popitem()
+        # The mask is built on the (small) time coordinate only, so that the data is indexed in a single pass.
         time_att = getattr(da.time.dt, key)
-        selected = da.sel(time=time_att.isin(val)).dropna(dim="time")
+        selected = da.isel(time=np.flatnonzero(time_att.isin(val).values))
 
     return selected
 
@@ -114,20 +115,21 @@ def select_resample_op(da: xr.DataArray, op: str, freq: str = "YS", **indexer):
     return r.map(op)
 
 
-def doymax(da: xr.DataArray) -> xr.DataArray:
-    """Return the day of year of the maximum value."""
-    i = da.argmax(dim="time")
-    out = da.time.dt.dayofyear[i]
+def _doy_at(da: xr.DataArray, i: xr.DataArray) -> xr.DataArray:
+    """Return the day of year at the given time indices of `da`, NaN where `da` has no valid values."""
+    out = da.time.dt.dayofyear[i].where(da.notnull().any(dim="time"))
     out.attrs.update(units="", is_dayofyear=1, calendar=get_calendar(da))
     return out
 
 
+def doymax(da: xr.DataArray) -> xr.DataArray:
+    """Return the day of year of the maximum value."""
+    return _doy_at(da, da.fillna(-np.inf).argmax(dim="time"))
+
+
 def doymin(da: xr.DataArray) -> xr.DataArray:
     """Return the day of year of the minimum value."""
-    i = da.argmin(dim="time")
-    out = da.time.dt.dayofyear[i]
-    out.attrs.update(units="", is_dayofyear=1, calendar=get_calendar(da))
-    return out
+    return _doy_at(da, da.fillna(np.inf).argmin(dim="time"))
 
 
 def default_freq(**indexer) -> str:
@@ -135,9 +137,10 @@ def default_freq(**indexer) -> str:
     freq = "AS-JAN"
     if indexer:
         group, value = indexer.popitem()
-        if "DJF" in value:
+        values = np.atleast_1d(value).tolist()
+        if "DJF" in values:
             freq = "AS-DEC"
-        if group == "month" and sorted(value) != value:
+        if group == "month" and any(a > b for a, b in zip(values, values[1:])):
             raise NotImplementedError
 
     return freq
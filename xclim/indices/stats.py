@@ -2,7 +2,6 @@
 
 from typing import Dict, Optional, Sequence, Tuple, Union
 
-import dask.array
 import numpy as np
 import xarray as xr
 
@@ -43,15 +42,22 @@ _lm3_dist_map = {
 }
 
 
+def _single_chunk(da: xr.DataArray, dim: str) -> xr.DataArray:
+    """Rechunk a dask-backed array to a single chunk along `dim`, if needed."""
+    if da.chunks is not None and len(da.chunks[da.get_axis_num(dim)]) > 1:
+        return da.chunk({dim: -1})
+    return da
+
+
 # Fit the parameters.
 # This would also be the place to impose constraints on the series minimum length if needed.
 def _fitfunc_1d(arr, *, dist, nparams, method, **fitkwargs):
     """Fit distribution parameters."""
-    x = np.ma.masked_invalid(arr).compressed()
+    x = arr[np.isfinite(arr)]
 
     # Return NaNs if array is empty.
     if len(x) <= 1:
-        return [np.nan] * nparams
+        return np.full(nparams, np.nan)
 
     # Estimate parameters
     if method == "ML":
@@ -61,6 +67,7 @@ def _fitfunc_1d(arr, *, dist, nparams, method, **fitkwargs):
         params = list(dist.lmom_fit(x).values())
 
     # Fill with NaNs if one of the parameters is NaN
+    params = np.asarray(params, dtype=float)
     if np.isnan(params).any():
         params[:] = np.nan
 
@@ -101,9 +108,15 @@ def fit(
     -----
     Coordinates for which all values are NaNs will be dropped before fitting the distribution. If the array
     still contains NaNs, the distribution parameters will be returned as NaNs.
+
+    Dask arrays chunked along `dim` are rechunked to a single chunk along that dimension before fitting.
+    Chunks along the other dimensions are left untouched, so the fit is still parallelized over them.
     """
     method_name = {"ML": "maximum likelihood", "PWM": "probability weighted moments"}
 
+    # The fit needs the whole series at once, rechunk once here instead of within each task.
+    da = _single_chunk(da, dim)
+
     # Get the distribution
     dc = get_dist(dist)
     if method == "PWM":
@@ -112,28 +125,27 @@ def fit(
     shape_params = [] if dc.shapes is None else dc.shapes.split(",")
     dist_params = shape_params + ["loc", "scale"]
 
-    # xarray.apply_ufunc does not yet support multiple outputs with dask parallelism.
-    duck = dask.array if isinstance(da.data, dask.array.Array) else np
-    data = duck.apply_along_axis(
+    data = xr.apply_ufunc(
         _fitfunc_1d,
-        da.get_axis_num(dim),
         da,
-        dist=dc if method == "ML" else lm3dc,
-        nparams=len(dist_params),
-        method=method,
-        **fitkwargs,
+        input_core_dims=[[dim]],
+        output_core_dims=[["dparams"]],
+        vectorize=True,
+        dask="parallelized",
+        output_dtypes=[float],
+        kwargs=dict(
+            dist=dc if method == "ML" else lm3dc,
+            nparams=len(dist_params),
+            method=method,
+            **fitkwargs,
+        ),
+        dask_gufunc_kwargs={"output_sizes": {"dparams": len(dist_params)}},
     )
 
-    # Coordinates for the distribution parameters
-    coords = dict(da.coords.items())
-    if dim in coords:
-        coords.pop(dim)
-    coords["dparams"] = dist_params
-
-    # Dimensions for the distribution parameters
+    # Put the distribution parameters where the fitted dimension was.
     dims = [d if d != dim else "dparams" for d in da.dims]
+    out = data.assign_coords(dparams=dist_params).transpose(*dims)
 
-    out = xr.DataArray(data=data, coords=coords, dims=dims)
     out.attrs = prefix_attrs(
         da.attrs, ["standard_name", "long_name", "units", "description"], "original_"
     )
@@ -181,28 +193,27 @@ def parametric_quantile(p: xr.DataArray, q: Union[int, Sequence]) -> xr.DataArra
     dist = p.attrs["scipy_dist"]
     dc = get_dist(dist)
 
-    # Create a lambda function to facilitate passing arguments to dask. There is probably a better way to do this.
-    if np.all(q > 0.5):
-
-        def func(x):
-            return dc.isf(1 - q, *x)
-
-    else:
-
-        def func(x):
-            return dc.ppf(q, *x)
-
-    duck = dask.array if isinstance(p.data, dask.array.Array) else np
-    data = duck.apply_along_axis(func, p.get_axis_num("dparams"), p)
+    # Scipy broadcasts the parameters against the quantiles, so all cells are evaluated in a single call.
+    def func(x):
+        params = [x[..., i, np.newaxis] for i in range(x.shape[-1])]
+        if np.all(q > 0.5):
+            return dc.isf(1 - q, *params)
+        return dc.ppf(q, *params)
+
+    data = xr.apply_ufunc(
+        func,
+        _single_chunk(p, "dparams"),
+        input_core_dims=[["dparams"]],
+        output_core_dims=[["quantile"]],
+        dask="parallelized",
+        output_dtypes=[float],
+        dask_gufunc_kwargs={"output_sizes": {"quantile": len(q)}},
+    )
 
-    # Create coordinate for the return periods
-    coords = dict(p.coords.items())
-    coords.pop("dparams")
-    coords["quantile"] = q
-    # Create dimensions
+    # Put the quantiles where the distribution parameters were.
     dims = [d if d != "dparams" else "quantile" for d in p.dims]
+    out = data.assign_coords(quantile=q).transpose(*dims)
 
-    out = xr.DataArray(data=data, coords=coords, dims=dims)
     out.attrs = unprefix_attrs(p.attrs, ["units", "standard_name"], "original_")
 
     attrs = dict(
@@ -220,7 +231,11 @@ def parametric_quantile(p: xr.DataArray, q: Union[int, Sequence]) -> xr.DataArra
 
 
 def fa(
-    da: xr.DataArray, t: Union[int, Sequence], dist: str = "norm", mode: str = "max"
+    da: xr.DataArray,
+    t: Union[int, Sequence],
+    dist: str = "norm",
+    mode: str = "max",
+    params: Optional[xr.DataArray] = None,
 ) -> xr.DataArray:
     """Return the value corresponding to the given return period.
 
@@ -236,14 +251,32 @@ def fa(
       (see scipy.stats).
     mode : {'min', 'max}
       Whether we are looking for a probability of exceedance (max) or a probability of non-exceedance (min).
+    params : xr.DataArray, optional
+      Distribution parameters of `da`, as returned by :py:func:`fit`. If given, the fit is skipped and `dist` must
+      match the `scipy_dist` attribute of `params`.
 
     Returns
     -------
     xarray.DataArray
       An array of values with a 1/t probability of exceedance (if mode=='max').
+
+    Notes
+    -----
+    Fitting the distribution is much more expensive than computing the quantiles. When computing values for multiple
+    return periods or modes from the same series, fit the parameters once and pass them along:
+
+    >>> params = fit(da, dist)  # doctest: +SKIP
+    >>> out = fa(da, [10, 20, 50, 100], dist, mode, params=params)  # doctest: +SKIP
     """
     # Fit the parameters of the distribution
-    p = fit(da, dist)
+    if params is None:
+        p = fit(da, dist)
+    elif params.attrs.get("scipy_dist") != dist:
+        raise ValueError(
+            f"Parameters were fitted with the `{params.attrs.get('scipy_dist')}` distribution, not `{dist}`."
+        )
+    else:
+        p = params
     t = np.atleast_1d(t)
 
     if mode in ["max", "high"]:
@@ -28,6 +28,37 @@ class TestSelectResampleOp:
         assert o[0] == 31 + 29
 
 
+class TestSelectTime:
+    def test_keeps_nans(self, q_series):
+        # Missing values within the selected period should not be dropped.
+        a = np.arange(365.0)
+        a[40] = np.nan
+        q = q_series(a)
+        out = generic.select_time(q, month=2)
+        assert out.time.size == 29
+        assert out.isnull().sum() == 1
+
+
+class TestDefaultFreq:
+    @pytest.mark.parametrize(
+        "indexer,exp",
+        [
+            ({}, "AS-JAN"),
+            ({"month": 1}, "AS-JAN"),
+            ({"month": [6, 7, 8]}, "AS-JAN"),
+            ({"month": (6, 7, 8)}, "AS-JAN"),
+            ({"season": "DJF"}, "AS-DEC"),
+            ({"season": ["DJF"]}, "AS-DEC"),
+        ],
+    )
+    def test_simple(self, indexer, exp):
+        assert generic.default_freq(**indexer) == exp
+
+    def test_unsorted_months(self):
+        with pytest.raises(NotImplementedError):
+            generic.default_freq(month=[12, 1, 2])
+
+
 class TestThresholdCount:
     def test_simple(self, tas_series):
         ts = tas_series(np.arange(365))
@@ -147,6 +178,16 @@ def test_doyminmax(q_series):
         assert da.attrs["is_dayofyear"] == 1
 
 
+def test_doyminmax_all_nan_period(q_series):
+    a = np.arange(731.0)
+    a[31:60] = np.nan  # February 2000
+    q = q_series(a)
+    dmx = generic.select_resample_op(q, op=generic.doymax, month=2)
+    dmn = generic.select_resample_op(q, op=generic.doymin, month=2)
+    np.testing.assert_array_equal(dmx, [np.nan, 59])
+    np.testing.assert_array_equal(dmn, [np.nan, 32])
+
+
 class TestAggregateBetweenDates:
     def test_calendars(self):
         # generate test DataArray
@@ -127,6 +127,14 @@ class TestFA(object):
         q0 = lognorm.ppf(1 - 1.0 / T, *p0)
         np.testing.assert_array_equal(q[0, 0, 0], q0)
 
+    def test_fa_params(self):
+        p = stats.fit(self.da, "lognorm")
+        q = stats.fa(self.da, [2, 10], "lognorm", params=p)
+        np.testing.assert_array_equal(q, stats.fa(self.da, [2, 10], "lognorm"))
+
+        with pytest.raises(ValueError):
+            stats.fa(self.da, 10, "norm", params=p)
+
     def test_fit_nan(self):
         da = self.da.copy()
         da[0, 0, 0] = np.nan
@@ -147,6 +155,26 @@ class TestFA(object):
         p = stats.fit(da)
         assert p.dims[-1] == "dparams"
 
+    def test_dask(self):
+        da = self.da.chunk({"x": 1})
+        p = stats.fit(da, "lognorm")
+        assert p.chunks is not None
+        np.testing.assert_array_equal(p, stats.fit(self.da, "lognorm"))
+
+        q = stats.fa(da, [2, 10], "lognorm")
+        assert q.chunks is not None
+        np.testing.assert_allclose(q, stats.fa(self.da, [2, 10], "lognorm"))
+
+        # Parameters chunked along `dparams`
+        p = stats.fit(self.da, "lognorm")
+        q = stats.parametric_quantile(p.chunk({"dparams": 1}), [0.1, 0.9])
+        np.testing.assert_allclose(q, stats.parametric_quantile(p, [0.1, 0.9]))
+
+    def test_dask_time_chunks(self):
+        # Chunked along the fitted dimension
+        p = stats.fit(self.da.chunk({"time": 10}), "lognorm")
+        np.testing.assert_array_equal(p, stats.fit(self.da, "lognorm"))
+
 
 class TestPWMFit:
     params = {
@@ -221,6 +249,23 @@ class TestFrequencyAnalysis:
             q.transpose(), mode="max", t=2, dist="genextreme", window=6, freq="YS"
         )
 
+    def test_dask_time_chunks(self, ndq_series):
+        # Rolling handles the time chunks, the resampled series is rechunked by `fit`.
+        q = ndq_series.copy()
+        exp = stats.frequency_analysis(
+            q, mode="max", t=2, dist="genextreme", window=6, freq="YS"
+        )
+        out = stats.frequency_analysis(
+            q.chunk({"time": 100}),
+            mode="max",
+            t=2,
+            dist="genextreme",
+            window=6,
+            freq="YS",
+        )
+        assert out.chunks is not None
+        np.testing.assert_allclose(out, exp)
+
 
 class TestParametricQuantile:
     def test_synth(self):